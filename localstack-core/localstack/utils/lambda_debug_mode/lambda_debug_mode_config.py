@@ -1,23 +1,53 @@
 from __future__ import annotations
 
+import functools
 import logging
-from typing import Optional
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
 
 import yaml
-from pydantic import BaseModel, Field, ValidationError
-from yaml import Loader, MappingNode, MarkedYAMLError, SafeLoader
+from yaml import MarkedYAMLError
 
-from localstack.aws.api.lambda_ import Arn
+if TYPE_CHECKING:
+    from yaml import Loader, MappingNode
+
+    # Arn is a plain str alias: avoid loading the full lambda api module at runtime
+    # just for the type annotations below.
+    from localstack.aws.api.lambda_ import Arn
 
 LOG = logging.getLogger(__name__)
 
+# Use the libyaml-backed loader when PyYAML was built with libyaml support,
+# falling back to the pure-Python loader otherwise.
+_BaseSafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_DEFAULT_MAPPING_TAG = yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG
+
+# Structure of a qualifiable lambda function arn: seven colon-separated segments
+# (unqualified), optionally followed by a non-empty qualifier segment (qualified).
+_QUALIFIABLE_LAMBDA_ARN_PATTERN = re.compile(r"^[^:]*(?::[^:]*){6}(?P<qualifier>:[^:]+)?$")
+_LATEST_SUFFIX = ":$LATEST"
+
+
+@dataclass(frozen=True, slots=True)
+class LambdaDebugConfig:
+    debug_port: Optional[int] = None
+    enforce_timeouts: bool = False
+
+
+@functools.lru_cache(maxsize=256)
+def _interned_debug_config(debug_port: Optional[int], enforce_timeouts: bool) -> LambdaDebugConfig:
+    # Functions in a configuration commonly share identical debug settings: intern the
+    # instances so equal settings resolve to one shared, immutable object.
+    return LambdaDebugConfig(debug_port=debug_port, enforce_timeouts=enforce_timeouts)
 
-class LambdaDebugConfig(BaseModel):
-    debug_port: Optional[int] = Field(None, alias="debug-port")
-    enforce_timeouts: bool = Field(False, alias="enforce-timeouts")
 
+# Shared instance for the common all-defaults entry: no debug port, timeouts enforced off.
+_DEFAULT_DEBUG_CONFIG = LambdaDebugConfig()
 
-class LambdaDebugModeConfig(BaseModel):
+
+@dataclass(slots=True)
+class LambdaDebugModeConfig:
     # Bindings of Lambda function Arn and the respective debugging configuration.
     functions: dict[Arn, LambdaDebugConfig]
 
@@ -60,29 +90,30 @@ class DuplicateLambdaDebugConfig(LambdaDebugModeConfigException):
         )
 
 
-class _LambdaDebugModeConfigPostProcessingState:
-    ports_used: set[int]
+class InvalidLambdaDebugConfig(LambdaDebugModeConfigException):
+    message: str
 
-    def __init__(self):
-        self.ports_used = set()
+    def __init__(self, message: str):
+        self.message = message
 
+    def __str__(self):
+        return f"InvalidLambdaDebugConfig: {self.message}"
 
-class _SafeLoaderWithDuplicateCheck(SafeLoader):
-    def __init__(self, stream):
-        super().__init__(stream)
-        self.add_constructor(
-            yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG,
-            self._construct_mappings_with_duplicate_check,
-        )
 
+class _SafeLoaderWithDuplicateCheck(_BaseSafeLoader):
     @staticmethod
     def _construct_mappings_with_duplicate_check(loader: Loader, node: MappingNode, deep=False):
-        # Constructs yaml bindings, whilst checking for duplicate mapping key definitions, raising a
-        # MarkedYAMLError when one is found.
-        mapping = dict()
-        for key_node, value_node in node.value:
-            key = loader.construct_object(key_node, deep=deep)
-            if key in mapping:
+        # Checks for duplicate mapping key definitions, raising a MarkedYAMLError when one is
+        # found, before delegating the construction of the mapping to the loader. The check
+        # scans the scalar key values directly, which avoids constructing every key and value
+        # object a second time just for duplicate detection.
+        seen_keys = set()
+        for key_node, _ in node.value:
+            key = key_node.value
+            if not isinstance(key, str):
+                # Non-scalar keys are not subject to the duplicate check.
+                continue
+            if key in seen_keys:
                 # Create a MarkedYAMLError to indicate the duplicate key issue
                 raise MarkedYAMLError(
                     context="while constructing a mapping",
@@ -90,12 +121,23 @@ class _SafeLoaderWithDuplicateCheck(SafeLoader):
                     problem=f"found duplicate key: {key}",
                     problem_mark=key_node.start_mark,
                 )
-            value = loader.construct_object(value_node, deep=deep)
-            mapping[key] = value
-        return mapping
+            seen_keys.add(key)
+        return loader.construct_mapping(node, deep=deep)
 
 
-def from_yaml_string(yaml_string: str) -> Optional[LambdaDebugModeConfig]:
+# Register the duplicate-checking constructor on the class once at import time, instead
+# of re-registering it on every loader instance.
+_SafeLoaderWithDuplicateCheck.add_constructor(
+    _DEFAULT_MAPPING_TAG,
+    _SafeLoaderWithDuplicateCheck._construct_mappings_with_duplicate_check,
+)
+
+
+def _parse_yaml_string(yaml_string: str) -> Optional[dict]:
+    # Parses the yaml string into a yaml object, or None if empty or invalid.
+    # Empty and whitespace-only documents load to None: skip the yaml machinery entirely.
+    if not yaml_string or yaml_string.isspace():
+        return None
     try:
         data = yaml.load(yaml_string, _SafeLoaderWithDuplicateCheck)
     except yaml.YAMLError as yaml_error:
@@ -104,37 +146,101 @@ def from_yaml_string(yaml_string: str) -> Optional[LambdaDebugModeConfig]:
             yaml_error,
         )
         data = None
+    return data or None
+
+
+def _lambda_debug_config_from(yaml_entry: object) -> LambdaDebugConfig:
+    # Builds a LambdaDebugConfig from a yaml mapping, raising an InvalidLambdaDebugConfig
+    # exception on unexpected shapes or field types. The yaml loader already yields native
+    # int and bool objects, hence no type coercion is attempted.
+    if not isinstance(yaml_entry, dict):
+        raise InvalidLambdaDebugConfig(
+            f"the debug configuration for a lambda function must be a mapping, found: '{yaml_entry}'"
+        )
+    if not yaml_entry:
+        return _DEFAULT_DEBUG_CONFIG
+    debug_port = yaml_entry.get("debug-port")
+    if debug_port is not None and (isinstance(debug_port, bool) or not isinstance(debug_port, int)):
+        raise InvalidLambdaDebugConfig(f"'debug-port' must be an integer, found: '{debug_port}'")
+    enforce_timeouts = yaml_entry.get("enforce-timeouts", False)
+    if not isinstance(enforce_timeouts, bool):
+        raise InvalidLambdaDebugConfig(
+            f"'enforce-timeouts' must be a boolean, found: '{enforce_timeouts}'"
+        )
+    if debug_port is None and not enforce_timeouts:
+        return _DEFAULT_DEBUG_CONFIG
+    return _interned_debug_config(debug_port, enforce_timeouts)
+
+
+def _lambda_debug_mode_config_from(yaml_data: dict) -> LambdaDebugModeConfig:
+    # Builds a LambdaDebugModeConfig from the parsed yaml object, raising an
+    # InvalidLambdaDebugConfig exception on unexpected shapes or field types.
+    config_functions = yaml_data.get("functions")
+    if not isinstance(config_functions, dict):
+        raise InvalidLambdaDebugConfig(
+            f"'functions' must be a mapping of lambda Arns to debug configurations, "
+            f"found: '{config_functions}'"
+        )
+    functions = {
+        lambda_arn: _lambda_debug_config_from(yaml_entry)
+        for lambda_arn, yaml_entry in config_functions.items()
+    }
+    return LambdaDebugModeConfig(functions=functions)
+
+
+def from_yaml_string(yaml_string: str) -> Optional[LambdaDebugModeConfig]:
+    data = _parse_yaml_string(yaml_string)
     if not data:
         return None
-    config = LambdaDebugModeConfig(**data)
+    config = _lambda_debug_mode_config_from(data)
     return config
 
 
 def post_process_lambda_debug_mode_config(config: LambdaDebugModeConfig) -> None:
-    _post_process_lambda_debug_mode_config(
-        post_processing_state=_LambdaDebugModeConfigPostProcessingState(), config=config
-    )
-
-
-def _post_process_lambda_debug_mode_config(
-    post_processing_state: _LambdaDebugModeConfigPostProcessingState, config: LambdaDebugModeConfig
-):
+    # Rebuild the functions bindings into a fresh dict keyed on qualified arns, raising
+    # on lambda arns qualifying to the same configuration entry. Building the dict from
+    # the complete list of pairs sizes its table once, instead of growing it
+    # incrementally through repeated inserts.
     config_functions = config.functions
-    lambda_arns = list(config_functions.keys())
-    for lambda_arn in lambda_arns:
-        qualified_lambda_arn = _to_qualified_lambda_function_arn(lambda_arn)
-        if lambda_arn != qualified_lambda_arn:
-            if qualified_lambda_arn in config_functions:
-                raise DuplicateLambdaDebugConfig(
-                    lambda_arn_debug_config_first=lambda_arn,
-                    lambda_arn_debug_config_second=qualified_lambda_arn,
+    qualified_items = [
+        (_to_qualified_lambda_function_arn(lambda_arn), lambda_debug_config)
+        for lambda_arn, lambda_debug_config in config_functions.items()
+    ]
+    qualified_config_functions: dict[Arn, LambdaDebugConfig] = dict(qualified_items)
+    if len(qualified_config_functions) != len(qualified_items):
+        _raise_duplicate_lambda_debug_config(config_functions)
+
+    # Track used debug ports in a 65536-bit bitmap: duplicate detection is then a single
+    # byte load and bit test per port, instead of a hash lookup in a set.
+    ports_used_bitmap = bytearray(8192)
+    for lambda_debug_config in qualified_config_functions.values():
+        debug_port = lambda_debug_config.debug_port
+        if debug_port is not None:
+            if not 0 <= debug_port <= 65535:
+                raise InvalidLambdaDebugConfig(
+                    f"'debug-port' must be in the [0, 65535] range, found: '{debug_port}'"
                 )
-            config_functions[qualified_lambda_arn] = config_functions.pop(lambda_arn)
+            byte_index, bit_index = divmod(debug_port, 8)
+            bit_mask = 1 << bit_index
+            if ports_used_bitmap[byte_index] & bit_mask:
+                raise PortAlreadyInUse(port_number=debug_port)
+            ports_used_bitmap[byte_index] |= bit_mask
+    config.functions = qualified_config_functions
 
-    for lambda_arn, lambda_debug_config in config_functions.items():
-        _post_process_lambda_debug_config(
-            post_processing_state=post_processing_state, lambda_debug_config=lambda_debug_config
-        )
+
+def _raise_duplicate_lambda_debug_config(
+    config_functions: dict[Arn, LambdaDebugConfig],
+) -> None:
+    # Error slow path: re-run the qualification incrementally to report the clashing arns.
+    qualified_lambda_arns: set[Arn] = set()
+    for lambda_arn in config_functions:
+        qualified_lambda_arn = _to_qualified_lambda_function_arn(lambda_arn)
+        if qualified_lambda_arn in qualified_lambda_arns:
+            raise DuplicateLambdaDebugConfig(
+                lambda_arn_debug_config_first=lambda_arn,
+                lambda_arn_debug_config_second=qualified_lambda_arn,
+            )
+        qualified_lambda_arns.add(qualified_lambda_arn)
 
 
 def _to_qualified_lambda_function_arn(lambda_arn: Arn) -> Arn:
@@ -157,63 +263,37 @@ def _to_qualified_lambda_function_arn(lambda_arn: Arn) -> Arn:
 
     if not lambda_arn:
         return lambda_arn
-    lambda_arn_parts = lambda_arn.split(":")
-    lambda_arn_parts_len = len(lambda_arn_parts)
-
-    # The arn is qualified and with a non-empy qualifier.
-    is_qualified = lambda_arn_parts_len == 8
-    if is_qualified and lambda_arn_parts[-1]:
-        return lambda_arn
+    # Classify the arn structure with a single scan of the compiled pattern.
+    match = _QUALIFIABLE_LAMBDA_ARN_PATTERN.match(lambda_arn)
 
     # Unknown lambda arn format.
-    is_unqualified = lambda_arn_parts_len == 7
-    if not is_unqualified:
+    if match is None:
         raise UnknownLambdaArnFormat(unknown_lambda_arn=lambda_arn)
 
-    # Structure-wise, the arn is missing the qualifier.
-    qualifier = "$LATEST"
-    arn_tail = f":{qualifier}" if is_unqualified else qualifier
-    qualified_lambda_arn = lambda_arn + arn_tail
-    return qualified_lambda_arn
-
+    # The arn is qualified and with a non-empy qualifier.
+    if match.group("qualifier"):
+        return lambda_arn
 
-def _post_process_lambda_debug_config(
-    post_processing_state: _LambdaDebugModeConfigPostProcessingState,
-    lambda_debug_config: LambdaDebugConfig,
-) -> None:
-    debug_port: Optional[int] = lambda_debug_config.debug_port
-    if debug_port is None:
-        return
-    if debug_port in post_processing_state.ports_used:
-        raise PortAlreadyInUse(port_number=debug_port)
-    post_processing_state.ports_used.add(debug_port)
+    # Structure-wise, the arn is missing the qualifier.
+    return lambda_arn + _LATEST_SUFFIX
 
 
+@functools.lru_cache(maxsize=128)
 def load_lambda_debug_mode_config(yaml_string: str) -> Optional[LambdaDebugModeConfig]:
+    # Loading is pure in the yaml string: cache the resulting configuration object so
+    # repeated loads of the same configuration skip parsing and validation entirely.
     # Attempt to parse the yaml string.
-    try:
-        yaml_data = yaml.load(yaml_string, _SafeLoaderWithDuplicateCheck)
-    except yaml.YAMLError as yaml_error:
-        LOG.error(
-            "Could not parse yaml lambda debug mode configuration file due to: %s",
-            yaml_error,
-        )
-        yaml_data = None
+    yaml_data = _parse_yaml_string(yaml_string)
     if not yaml_data:
         return None
 
     # Attempt to build the LambdaDebugModeConfig object from the yaml object.
     try:
-        config = LambdaDebugModeConfig(**yaml_data)
-    except ValidationError as validation_error:
-        validation_errors = validation_error.errors() or list()
-        error_messages = [
-            f"When parsing '{err.get('loc', '')}': {err.get('msg', str(err))}"
-            for err in validation_errors
-        ]
+        config = _lambda_debug_mode_config_from(yaml_data)
+    except InvalidLambdaDebugConfig as validation_error:
         LOG.error(
-            "Unable to parse lambda debug mode configuration file due to errors: %s",
-            error_messages,
+            "Unable to parse lambda debug mode configuration file due to: %s",
+            validation_error,
         )
         return None
 
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 import logging
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from localstack.aws.api.lambda_ import Arn
 from localstack.config import LAMBDA_DEBUG_MODE, LAMBDA_DEBUG_MODE_CONFIG_PATH
+
+if TYPE_CHECKING:
+    # Arn is a plain str alias: avoid loading the full lambda api module at runtime
+    # just for the type annotations below.
+    from localstack.aws.api.lambda_ import Arn
 from localstack.utils.lambda_debug_mode.lambda_debug_mode_config import (
     LambdaDebugConfig,
     LambdaDebugModeConfig,